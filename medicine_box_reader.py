@@ -1,33 +1,54 @@
+import os
+import pickle
+import queue
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import unicodedata
 import cv2
-import pytesseract
-import spacy
+from PIL import Image
+from tesserocr import PyTessBaseAPI, PSM, OEM
 import numpy as np
-import pyttsx3  # For text-to-speech
-import tensorflow as tf
-from tensorflow.keras.models import Sequential
-from tensorflow.keras.layers import Dense, Embedding, GlobalAveragePooling1D
+# TensorFlow, spaCy, pyttsx3 and pandas are imported lazily inside the
+# functions that need them, to keep startup fast.
 
-# Additional libraries for CSV loading and fuzzy matching
-import pandas as pd
-from rapidfuzz import process
+# Additional libraries for fuzzy matching
+from rapidfuzz import process, fuzz
+from rapidfuzz.utils import default_process
+
+# Threads for the C-level work (RapidFuzz matching, TFLite inference);
+# respects the CPU affinity mask on shared hosts where it's available.
+_CPU_WORKERS = (len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity")
+                else os.cpu_count() or 1)
 
 # -------------------------------
 # Part 1: Computer Vision & OCR
 # -------------------------------
-def capture_image_from_webcam():
+# Let OpenCV run cvtColor/threshold as OpenCL kernels when a GPU is available
+_USE_OPENCL = cv2.ocl.haveOpenCL()
+cv2.ocl.setUseOpenCL(_USE_OPENCL)
+
+def capture_image_from_webcam(max_width=1280, save_path=None):
     """
     Captures an image from the default webcam, displays the live video feed,
     and waits for the user to press 'c' to capture or 'q' to quit.
-    Returns the path to the saved image (e.g., "temp.jpg").
+    The camera is asked for 720p; frames wider than `max_width` (i.e. when
+    the camera ignores that request) are downscaled, which is plenty for
+    box-label OCR and cuts Tesseract's work.
+    Returns the captured frame as a BGR array, or None if nothing was captured.
+    Pass `save_path` (e.g. "capture.png", lossless) to also write it to disk
+    for debugging.
     """
     cap = cv2.VideoCapture(0)  # 0 = default camera; change if you have multiple
     if not cap.isOpened():
         raise IOError("Cannot open webcam")
+    # Ask for 720p instead of the camera default (often 1080p)
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
 
     print("Press 'c' to capture an image, or 'q' to quit.")
 
-    saved_image_path = "temp.jpg"
+    captured_frame = None
 
     while True:
         ret, frame = cap.read()
@@ -40,85 +61,194 @@ def capture_image_from_webcam():
         key = cv2.waitKey(1) & 0xFF
 
         if key == ord('c'):
-            # Save the frame to disk
-            cv2.imwrite(saved_image_path, frame)
-            print(f"Image captured and saved to {saved_image_path}")
+            h, w = frame.shape[:2]
+            if w > max_width:
+                frame = cv2.resize(frame, (max_width, int(h * max_width / w)),
+                                   interpolation=cv2.INTER_AREA)
+            captured_frame = frame
+            print("Image captured.")
+            if save_path:
+                cv2.imwrite(save_path, frame)
+                print(f"Image saved to {save_path}")
             break
         elif key == ord('q'):
             print("Quitting without capturing image.")
-            saved_image_path = None
             break
 
     cap.release()
     cv2.destroyAllWindows()
-    return saved_image_path
+    return captured_frame
 
-def preprocess_image(image_path):
+def preprocess_image(image, min_density=0.01, min_contrast=20):
     """
-    Reads the image, converts it to grayscale, and applies thresholding.
+    Converts a BGR image array to grayscale and applies thresholding.
     This helps Tesseract OCR get a cleaner input.
+    Returns None when the frame is blank, e.g. a covered lens or a plain
+    wall, so the caller can skip OCR and NLP entirely.
     """
-    image = cv2.imread(image_path)
     if image is None:
-        raise ValueError(f"Image not found at {image_path}!")
+        raise ValueError("No image to preprocess!")
+    if _USE_OPENCL:
+        image = cv2.UMat(image)
     gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
     # Use Otsu's thresholding to binarize the image
+    # (OpenCV's histogram/threshold kernels are already SIMD-vectorized)
     _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+    # Otsu splits even pure sensor noise into two similar-sized classes, so
+    # also require a real brightness gap between them
+    contrast = class_contrast(gray, thresh)
+    if _USE_OPENCL:
+        thresh = thresh.get()
+    if foreground_density(thresh) < min_density or contrast < min_contrast:
+        return None
     return thresh
 
+def class_contrast(gray, thresh):
+    """
+    Returns the gap between the mean gray levels of the two Otsu classes.
+    Blank frames stay in the single digits; printed labels are far higher.
+    """
+    bright_mean = cv2.mean(gray, mask=thresh)[0]
+    dark_mean = cv2.mean(gray, mask=cv2.bitwise_not(thresh))[0]
+    return bright_mean - dark_mean
+
+def foreground_density(thresh):
+    """
+    Returns the fraction of pixels in the smaller of the two Otsu classes.
+    Polarity-agnostic, so dark-on-light and light-on-dark labels are
+    treated alike.
+    """
+    density = np.count_nonzero(thresh) / thresh.size
+    return min(density, 1.0 - density)
+
+_API = None
+
+def _get_tesseract():
+    """
+    Creates the in-process Tesseract API once and reuses it, so the
+    recognition model stays loaded between images.
+    Equivalent to the command-line config '--oem 3 --psm 6'.
+    """
+    global _API
+    if _API is None:
+        _API = PyTessBaseAPI(psm=PSM.SINGLE_BLOCK, oem=OEM.DEFAULT)
+    return _API
+
 def extract_text_from_image(image):
     """
-    Uses pytesseract to perform OCR on the preprocessed image.
+    Uses tesserocr to perform OCR on the preprocessed image.
     """
-    custom_config = r'--oem 3 --psm 6'
-    text = pytesseract.image_to_string(image, config=custom_config)
+    api = _get_tesseract()
+    api.SetImage(Image.fromarray(image))
+    text = api.GetUTF8Text()
     return text
 
 # -------------------------------
 # Part 2: Natural Language Processing
 # -------------------------------
-def extract_info_with_nlp(text):
+_NLP = None
+
+def _get_nlp():
+    """
+    Loads the spaCy pipeline once and reuses it on later calls.
+    Only the NER component is needed, so the unused ones are disabled.
+    """
+    global _NLP
+    if _NLP is None:
+        import spacy
+        _NLP = spacy.load("en_core_web_sm",
+                          disable=["parser", "tagger", "lemmatizer", "attribute_ruler"])
+    return _NLP
+
+def extract_info_with_nlp(texts, batch_size=32):
     """
-    Uses spaCy to process the extracted text and return identified entities.
+    Uses spaCy to process a list of text chunks (e.g. OCR lines) in batches
+    and returns the identified entities as one list per chunk.
     You can later add more rules to extract specific information such as
     medicine names, expiry dates, batch numbers, etc.
     """
-    nlp = spacy.load("en_core_web_sm")
-    doc = nlp(text)
-    entities = [(ent.text, ent.label_) for ent in doc.ents]
+    docs = _get_nlp().pipe(texts, batch_size=batch_size, n_process=1)
+    entities = [[(ent.text, ent.label_) for ent in doc.ents] for doc in docs]
     return entities
 
 # -------------------------------
 # Part 2.5: Medication Matching with CSV
 # -------------------------------
+def _normalize(text):
+    """
+    Folds accents to plain ASCII (e.g. 'á' -> 'a'), then applies RapidFuzz's
+    default processing (lowercase, non-alphanumerics to spaces, trim).
+    """
+    ascii_text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode()
+    return default_process(ascii_text)
+
+# Bump whenever the cached lists change shape or normalization, so pickles
+# written by older code are rebuilt instead of reused
+_MED_CACHE_VERSION = 2
+
 def load_medication_list(csv_path):
     """
     Loads a CSV file containing medication names.
     Assumes there's a column named 'Molecule'.
+    Returns the unique lowercased names together with their ASCII-folded,
+    RapidFuzz-normalized form. Both are cached in a pickle next to the CSV
+    and reused until the CSV's modification time or the cache format changes.
     """
-    df = pd.read_csv(csv_path)
+    cache_path = os.path.splitext(csv_path)[0] + ".pkl"
+    cache_key = (_MED_CACHE_VERSION, os.path.getmtime(csv_path))
+    try:
+        with open(cache_path, "rb") as f:
+            cached_key, medication_list, processed_meds = pickle.load(f)
+        if cached_key == cache_key:
+            return medication_list, processed_meds
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError,
+            ImportError, IndexError, ValueError, TypeError):
+        pass  # Missing, unreadable or malformed cache: rebuild from the CSV
+
+    import pandas as pd
     # Adjust column name to whatever matches your CSV
-    medication_list = df['Molecule'].tolist()
-    # Convert to lowercase for more consistent matching
-    medication_list = [med.lower() for med in medication_list]
-    return medication_list
+    df = pd.read_csv(csv_path, usecols=['Molecule'], dtype=str, engine='c')
+    # Convert to lowercase for more consistent matching; the CSV lists a
+    # molecule once per formulation, so keep each name only once
+    medication_list = df['Molecule'].str.lower().drop_duplicates().tolist()
+    processed_meds = [_normalize(med) for med in medication_list]
+    try:
+        with open(cache_path, "wb") as f:
+            pickle.dump((cache_key, medication_list, processed_meds), f)
+    except OSError as e:
+        print(f"Could not write medication cache {cache_path}: {e}")
+    return medication_list, processed_meds
 
-def match_medications_fuzzy(text, medication_list, threshold=85):
+def match_medications_fuzzy(text, medication_list, threshold=85, processed_meds=None):
     """
-    Splits the extracted text into tokens and uses fuzzy matching against
-    the medication list. Returns a set of recognized medication names.
+    Uses fuzzy matching of the extracted text against the medication list.
+    Returns a set of recognized medication names.
     
     - `threshold=85` can be adjusted for stricter or looser matching.
+    - `processed_meds` is the medication list already run through
+      `_normalize`; pass it in to avoid re-normalizing on every call.
     """
-    tokens = text.lower().split()
-    recognized_meds = set()
+    processed_text = _normalize(text)
+    tokens = processed_text.split()
+    if not tokens or not medication_list:
+        return set()
+    if processed_meds is None:
+        processed_meds = [_normalize(med) for med in medication_list]
+
+    # Whole-text pass: token_set_ratio catches multi-word names
+    # ("sodium chloride") whose words all appear somewhere in the text
+    text_scores = process.cdist([processed_text], processed_meds, scorer=fuzz.token_set_ratio,
+                                score_cutoff=threshold, workers=_CPU_WORKERS, dtype=np.uint8)
+    recognized_meds = {medication_list[i] for i in np.flatnonzero(text_scores[0] >= threshold)}
 
-    for token in tokens:
-        result = process.extractOne(token, medication_list)
-        if result is not None:
-            match, score, _ = result
-            if score >= threshold:
-                recognized_meds.add(match)
+    # Per-token pass: catches single OCR'd words with typos ("amoxicilin").
+    # Score every token against every medication in a single C call
+    scores = process.cdist(tokens, processed_meds, scorer=fuzz.WRatio,
+                           score_cutoff=threshold, workers=_CPU_WORKERS, dtype=np.uint8)
+    # Keep the best match per token, as extractOne would
+    best = scores.argmax(axis=1)
+    hits = best[scores[np.arange(len(tokens)), best] >= threshold]
+    recognized_meds.update(medication_list[i] for i in hits)
     return recognized_meds
 
 # -------------------------------
@@ -129,72 +259,244 @@ def create_text_classification_model(vocab_size, embedding_dim, max_length, num_
     Creates a simple text classification model.
     In a production scenario, you would train this model on labeled data.
     """
+    from tensorflow.keras.models import Sequential
+    from tensorflow.keras.layers import Dense, Embedding, GlobalAveragePooling1D
+
     model = Sequential([
         Embedding(vocab_size, embedding_dim, input_length=max_length),
         GlobalAveragePooling1D(),
         Dense(24, activation='relu'),
         Dense(num_classes, activation='softmax')
     ])
+    # Build eagerly so the model can be converted without a predict() call
+    model.build(input_shape=(None, max_length))
     
     model.compile(loss='sparse_categorical_crossentropy',
                   optimizer='adam',
                   metrics=['accuracy'])
     return model
 
-def convert_model_to_tflite(model, tflite_model_path):
+def classify_with_numpy(model, input_data):
+    """
+    Runs the forward pass of the small demo model (Embedding -> mean pooling
+    -> Dense(relu) -> Dense(softmax)) directly in NumPy using its Keras
+    weights, avoiding the overhead of `model.predict` for a single sample.
+    """
+    embeddings = model.layers[0].get_weights()[0]
+    w1, b1 = model.layers[2].get_weights()
+    w2, b2 = model.layers[3].get_weights()
+    x = embeddings[input_data].mean(axis=1)
+    h = np.maximum(0, x @ w1 + b1)
+    logits = h @ w2 + b2
+    probs = np.exp(logits - logits.max(axis=1, keepdims=True))
+    probs /= probs.sum(axis=1, keepdims=True)
+    return probs
+
+def _representative_dataset(model, num_samples=100):
+    """
+    Yields random token sequences shaped like the model input so the
+    converter can calibrate int8 activation ranges.
+    """
+    vocab_size = model.layers[0].input_dim
+    max_length = model.input_shape[1]
+    for _ in range(num_samples):
+        yield [np.random.randint(0, vocab_size, size=(1, max_length)).astype(np.float32)]
+
+def convert_model_to_tflite(model, tflite_model_path, quantization="float16"):
     """
     Converts the given TensorFlow/Keras model to a TensorFlow Lite model.
+
+    - `quantization="float16"` halves the model size and keeps float compute,
+      so it runs well on x86 desktops and the GPU delegate.
+    - `quantization="dynamic"` stores int8 weights with float activations.
+    - `quantization="int8"` is full-integer and only pays off on ARM/NEON
+      mobile targets; int8 kernels are often slower than float on x86.
+    - `quantization=None` keeps the plain float32 model.
     """
+    import tensorflow as tf
+
+    print(f"Converting with TensorFlow {tf.__version__}")
+    tf_version = tuple(int(part) for part in tf.__version__.split(".")[:2])
+    if tf_version < (2, 5):
+        print("Warning: TensorFlow < 2.5 may produce slow quantized kernels; please upgrade.")
     converter = tf.lite.TFLiteConverter.from_keras_model(model)
-    # (Optional) Enable optimization for a smaller and faster model:
-    # converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    # Use the MLIR-based converter and quantizer explicitly (the default since
+    # TF 2.4); the legacy TOCO path can emit slow unfused quantized ops.
+    converter.experimental_new_converter = True
+    converter.experimental_new_quantizer = True
+    if quantization == "float16":
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.target_spec.supported_types = [tf.float16]
+    elif quantization == "dynamic":
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    elif quantization == "int8":
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.representative_dataset = lambda: _representative_dataset(model)
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+        # The input stays float32: token ids go up to vocab_size and would be
+        # clipped by an int8 input tensor before reaching the Embedding lookup.
+        converter.inference_output_type = tf.int8
+    elif quantization is not None:
+        raise ValueError(f"Unknown quantization mode: {quantization}")
     tflite_model = converter.convert()
     with open(tflite_model_path, "wb") as f:
         f.write(tflite_model)
     print(f"Converted model saved to {tflite_model_path}")
 
+_INTERPRETERS = {}
+
+def _get_interpreter(tflite_model_path):
+    """
+    Creates one TFLite interpreter per model file, allocates its tensors, and
+    reuses it (with its input/output tensor indices) on later calls.
+    The entry is rebuilt when the file is re-converted (its mtime changes).
+    For int8 models, also caches the output's (scale, zero_point).
+    """
+    model_path = os.path.abspath(tflite_model_path)
+    model_mtime = os.stat(model_path).st_mtime_ns
+    cached = _INTERPRETERS.get(model_path)
+    if cached is None or cached[0] != model_mtime:
+        # The standalone LiteRT / TFLite runtimes enable the XNNPACK CPU
+        # delegate by default; fall back to the interpreter bundled with full
+        # TensorFlow (deprecated there since TF 2.20) only if neither exists.
+        try:
+            from ai_edge_litert.interpreter import Interpreter
+        except ImportError:
+            try:
+                from tflite_runtime.interpreter import Interpreter
+            except ImportError:
+                import tensorflow as tf
+                Interpreter = tf.lite.Interpreter
+        interpreter = Interpreter(model_path=model_path, num_threads=_CPU_WORKERS)
+        interpreter.allocate_tensors()
+        input_index = interpreter.get_input_details()[0]['index']
+        output_details = interpreter.get_output_details()[0]
+        output_quant = None
+        if output_details['dtype'] == np.int8:
+            output_quant = output_details['quantization']
+        cached = (model_mtime,
+                  (interpreter, input_index, output_details['index'], output_quant))
+        _INTERPRETERS[model_path] = cached
+    return cached[1]
+
+def classify_with_tflite(input_data, tflite_model_path):
+    """
+    Runs the converted TFLite model on a batch of token sequences and
+    returns the class probabilities, whatever the quantization mode.
+    """
+    interpreter, input_index, output_index, output_quant = _get_interpreter(tflite_model_path)
+    interpreter.set_tensor(input_index, input_data.astype(np.float32))
+    interpreter.invoke()
+    output = interpreter.get_tensor(output_index)
+    if output_quant is not None:
+        # int8 models end in TFLite's int8 softmax, so the codes are
+        # already quantized probabilities
+        scale, zero_point = output_quant
+        output = (output.astype(np.float32) - zero_point) * scale
+    return output
+
 # -------------------------------
 # Part 4: Text-to-Speech Helper
 # -------------------------------
+_TTS = None
+
+def _tts_worker(phrases):
+    """
+    Owns the pyttsx3 engine (it must be driven from the thread that created
+    it) and speaks queued phrases, batching whatever is already waiting
+    into a single runAndWait().
+    """
+    try:
+        import pyttsx3  # For text-to-speech
+        engine = pyttsx3.init()
+        # Optionally adjust speech rate, volume, voice, etc.
+        engine.setProperty('rate', 150)    # Speed percent (can go faster/slower)
+        engine.setProperty('volume', 1.0)  # Volume 0.0 to 1.0
+    except Exception as e:
+        print(f"Text-to-speech unavailable: {e}")
+        engine = None
+    while True:
+        batch = [phrases.get()]
+        while not phrases.empty():
+            batch.append(phrases.get_nowait())
+        try:
+            if engine is not None:
+                for text in batch:
+                    engine.say(text)
+                engine.runAndWait()
+        except Exception as e:
+            print(f"Text-to-speech failed: {e}")
+        finally:
+            # Always mark the batch done so speak_flush() never hangs
+            for _ in batch:
+                phrases.task_done()
+
+def _get_tts():
+    """
+    Starts the text-to-speech thread once and returns its phrase queue.
+    """
+    global _TTS
+    if _TTS is None:
+        _TTS = queue.Queue()
+        threading.Thread(target=_tts_worker, args=(_TTS,), daemon=True).start()
+    return _TTS
+
 def speak_text(text):
     """
-    Uses pyttsx3 for offline text-to-speech.
-    Adjust voice properties as needed.
+    Queues text for offline text-to-speech with pyttsx3. Speech runs on a
+    background thread, so this returns immediately.
     """
-    engine = pyttsx3.init()
-    # Optionally adjust speech rate, volume, voice, etc.
-    engine.setProperty('rate', 150)    # Speed percent (can go faster/slower)
-    engine.setProperty('volume', 1.0)  # Volume 0.0 to 1.0
-    engine.say(text)
-    engine.runAndWait()
+    _get_tts().put(text)
+
+def speak_flush():
+    """
+    Blocks until every queued phrase has been spoken.
+    """
+    _get_tts().join()
 
 # -------------------------------
 # Main Pipeline Function
 # -------------------------------
 def main():
     # 1) Capture an image from the user's webcam
-    image_path = capture_image_from_webcam()
-    if not image_path:
+    image = capture_image_from_webcam()
+    if image is None:
         print("No image captured. Exiting.")
         return
 
     # 2) Preprocess and run OCR
-    processed_image = preprocess_image(image_path)
-    extracted_text = extract_text_from_image(processed_image)
-    print("=== Extracted Text ===")
-    print(extracted_text)
+    processed_image = preprocess_image(image)
+    if processed_image is None:
+        print("Captured image looks blank. Exiting.")
+        return
+
+    medication_list_csv = r"D:\Capstone_NU\flutter_application_1\DOH_Medication_List.csv"
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        # Load spaCy and the medication list while Tesseract runs
+        nlp_future = executor.submit(_get_nlp)
+        meds_future = executor.submit(load_medication_list, medication_list_csv)
+
+        extracted_text = extract_text_from_image(processed_image)
+        print("=== Extracted Text ===")
+        print(extracted_text)
+
+        # 3) Process text using NLP (Named Entities), in the background
+        text_chunks = [line for line in extracted_text.splitlines() if line.strip()]
+        nlp_future.result()
+        entities_future = executor.submit(extract_info_with_nlp, text_chunks)
+
+        # 4) Match text against medication CSV (fuzzy) while NER runs
+        medication_list, processed_meds = meds_future.result()
+        recognized_meds = match_medications_fuzzy(extracted_text, medication_list, threshold=85,
+                                                  processed_meds=processed_meds)
+
+        entities = entities_future.result()
 
-    # 3) Process text using NLP (Named Entities)
-    entities = extract_info_with_nlp(extracted_text)
     print("\n=== Extracted Entities (via spaCy NER) ===")
-    for ent_text, ent_label in entities:
-        print(f"{ent_text} ({ent_label})")
+    for chunk_entities in entities:
+        for ent_text, ent_label in chunk_entities:
+            print(f"{ent_text} ({ent_label})")
 
-    # 4) Match text against medication CSV (fuzzy)
-    medication_list_csv = r"D:\Capstone_NU\flutter_application_1\DOH_Medication_List.csv"
-    medication_list = load_medication_list(medication_list_csv)
-    
-    recognized_meds = match_medications_fuzzy(extracted_text, medication_list, threshold=85)
     print("\n=== Recognized Medications (Fuzzy Matching) ===")
     if recognized_meds:
         # Read each recognized medication out loud
@@ -205,23 +507,33 @@ def main():
         print("No recognized medications.")
         speak_text("No recognized medications found.")
 
-    # 5) (Optional) Run text through a ML model (example)
-    vocab_size = 1000      # Example vocabulary size
-    embedding_dim = 16     # Dimension for word embeddings
-    max_length = 100       # Maximum token sequence length
-    num_classes = 3        # Assume we have three target classes
+    # Speech plays on a background thread; make sure the medication
+    # announcement finishes even if the model demo below fails
+    try:
+        # 5) (Optional) Run text through a ML model (example)
+        vocab_size = 1000      # Example vocabulary size
+        embedding_dim = 16     # Dimension for word embeddings
+        max_length = 100       # Maximum token sequence length
+        num_classes = 3        # Assume we have three target classes
     
-    model = create_text_classification_model(vocab_size, embedding_dim, max_length, num_classes)
+        model = create_text_classification_model(vocab_size, embedding_dim, max_length, num_classes)
     
-    # For demonstration, we simulate tokenized input with random integers.
-    dummy_input = np.random.randint(0, vocab_size, size=(1, max_length))
-    prediction = model.predict(dummy_input)
-    print("\n=== Dummy Classification Prediction ===")
-    print(prediction)
-    
-    # 6) Convert the model to TensorFlow Lite (if needed)
-    tflite_model_path = "text_classification_model.tflite"
-    convert_model_to_tflite(model, tflite_model_path)
+        # For demonstration, we simulate tokenized input with random integers.
+        dummy_input = np.random.randint(0, vocab_size, size=(1, max_length))
+        prediction = classify_with_numpy(model, dummy_input)
+        print("\n=== Dummy Classification Prediction ===")
+        print(prediction)
+
+        # 6) Convert the model to TensorFlow Lite (if needed)
+        tflite_model_path = "text_classification_model.tflite"
+        convert_model_to_tflite(model, tflite_model_path)
+
+        # Run the same input through the converted model as a sanity check
+        tflite_prediction = classify_with_tflite(dummy_input, tflite_model_path)
+        print("\n=== Dummy Classification Prediction (TFLite) ===")
+        print(tflite_prediction)
+    finally:
+        speak_flush()
 
 # -------------------------------
 # Entry Point